@@ -1,85 +1,82 @@
+import os
+import sys
+
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+
+# The id and CSV helpers are shared with the ETL pipeline in scripts/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'scripts'))
+from etl_utils import format_ids, write_csv
 
 # Set random seed for reproducibility
-np.random.seed(42)
+rng = np.random.default_rng(42)
 
 # Generate sample impressions data
 n_impressions = 10000
 channels = ['Google Search', 'Facebook', 'Instagram', 'TikTok', 'YouTube', 'Display Network', 'Campus Radio', 'Campus TV']
 devices = ['mobile', 'desktop', 'tablet']
 audiences = ['students', 'faculty', 'staff', 'alumni']
+creatives = ['image', 'video', 'text']
+
+
+def weighted_choice(options, p, size):
+    """Sample options with probabilities p by inverting a precomputed CDF"""
+    cdf = np.cumsum(p)
+    cdf /= cdf[-1]
+    return np.asarray(options)[np.searchsorted(cdf, rng.random(size), side='right')]
+
 
-# Generate impressions
-impressions_data = []
-for i in range(n_impressions):
-    timestamp = datetime(2024, 1, 1) + timedelta(days=np.random.randint(0, 365), hours=np.random.randint(0, 24))
-    
-    impression = {
-        'impression_id': f'imp_{i:08d}',
-        'user_id': f'user_{np.random.randint(1, 5000):06d}',
-        'channel': np.random.choice(channels),
-        'campaign_id': f'camp_{np.random.randint(1, 20):03d}',
-        'ad_placement': f'placement_{np.random.randint(1, 50):03d}',
-        'timestamp': timestamp,
-        'cost': np.random.uniform(0.05, 0.25),
-        'device_type': np.random.choice(devices, p=[0.6, 0.3, 0.1]),
-        'audience_segment': np.random.choice(audiences, p=[0.5, 0.2, 0.2, 0.1]),
-        'creative_type': np.random.choice(['image', 'video', 'text'], p=[0.5, 0.3, 0.2])
-    }
-    impressions_data.append(impression)
-
-impressions_df = pd.DataFrame(impressions_data)
+# Generate impressions (one vectorized draw per column)
+days = rng.integers(0, 365, n_impressions)
+hours = rng.integers(0, 24, n_impressions)
+timestamps = np.datetime64('2024-01-01') + days * np.timedelta64(1, 'D') + hours * np.timedelta64(1, 'h')
+
+impressions_df = pd.DataFrame({
+    'impression_id': format_ids('imp_', np.arange(n_impressions)),
+    'user_id': format_ids('user_', rng.integers(1, 5000, n_impressions), 6),
+    'channel': rng.choice(channels, n_impressions),
+    'campaign_id': format_ids('camp_', rng.integers(1, 20, n_impressions), 3),
+    'ad_placement': format_ids('placement_', rng.integers(1, 50, n_impressions), 3),
+    'timestamp': timestamps,
+    'cost': rng.uniform(0.05, 0.25, n_impressions).astype(np.float32),
+    'device_type': weighted_choice(devices, [0.6, 0.3, 0.1], n_impressions),
+    'audience_segment': weighted_choice(audiences, [0.5, 0.2, 0.2, 0.1], n_impressions),
+    'creative_type': weighted_choice(creatives, [0.5, 0.3, 0.2], n_impressions)
+})
+
+# Store low-cardinality labels as categoricals (clicks and conversions inherit them)
+for col in ['channel', 'device_type', 'audience_segment', 'creative_type']:
+    impressions_df[col] = impressions_df[col].astype('category')
 
 # Generate clicks (about 2% CTR)
-clicks_data = []
-click_id = 0
-for _, impression in impressions_df.iterrows():
-    if np.random.random() < 0.02:  # 2% CTR
-        click = {
-            'click_id': f'click_{click_id:08d}',
-            'impression_id': impression['impression_id'],
-            'user_id': impression['user_id'],
-            'channel': impression['channel'],
-            'campaign_id': impression['campaign_id'],
-            'ad_placement': impression['ad_placement'],
-            'click_timestamp': impression['timestamp'] + timedelta(seconds=np.random.randint(1, 300)),
-            'device_type': impression['device_type'],
-            'audience_segment': impression['audience_segment']
-        }
-        clicks_data.append(click)
-        click_id += 1
-
-clicks_df = pd.DataFrame(clicks_data)
+click_mask = rng.random(len(impressions_df)) < 0.02
+n_clicks = int(click_mask.sum())
+
+clicks_df = impressions_df.loc[click_mask, [
+    'impression_id', 'user_id', 'channel', 'campaign_id', 'ad_placement',
+    'timestamp', 'device_type', 'audience_segment'
+]].reset_index(drop=True).rename(columns={'timestamp': 'click_timestamp'})
+clicks_df['click_timestamp'] += rng.integers(1, 300, n_clicks) * np.timedelta64(1, 's')
+clicks_df.insert(0, 'click_id', format_ids('click_', np.arange(n_clicks)))
 
 # Generate conversions (about 5% of clicks convert)
-conversions_data = []
-conv_id = 0
-for _, click in clicks_df.iterrows():
-    if np.random.random() < 0.05:  # 5% conversion rate
-        conversion = {
-            'conversion_id': f'conv_{conv_id:08d}',
-            'click_id': click['click_id'],
-            'user_id': click['user_id'],
-            'channel': click['channel'],
-            'campaign_id': click['campaign_id'],
-            'ad_placement': click['ad_placement'],
-            'conversion_timestamp': click['click_timestamp'] + timedelta(hours=np.random.randint(1, 48)),
-            'conversion_value': np.random.uniform(20, 500),
-            'conversion_type': np.random.choice(['purchase', 'signup', 'download'], p=[0.6, 0.3, 0.1]),
-            'device_type': click['device_type'],
-            'audience_segment': click['audience_segment']
-        }
-        conversions_data.append(conversion)
-        conv_id += 1
-
-conversions_df = pd.DataFrame(conversions_data)
+conv_mask = rng.random(n_clicks) < 0.05
+n_conversions = int(conv_mask.sum())
+
+conversions_df = clicks_df.loc[conv_mask, [
+    'click_id', 'user_id', 'channel', 'campaign_id', 'ad_placement',
+    'click_timestamp', 'device_type', 'audience_segment'
+]].reset_index(drop=True).rename(columns={'click_timestamp': 'conversion_timestamp'})
+conversions_df['conversion_timestamp'] += rng.integers(1, 48, n_conversions) * np.timedelta64(1, 'h')
+conversions_df.insert(0, 'conversion_id', format_ids('conv_', np.arange(n_conversions)))
+conversions_df.insert(7, 'conversion_value', rng.uniform(20, 500, n_conversions).astype(np.float32))
+conversions_df.insert(8, 'conversion_type', weighted_choice(['purchase', 'signup', 'download'], [0.6, 0.3, 0.1], n_conversions))
+conversions_df['conversion_type'] = conversions_df['conversion_type'].astype('category')
 
 # Save the data
-impressions_df.to_csv('data/raw_impressions.csv', index=False)
-clicks_df.to_csv('data/raw_clicks.csv', index=False)
-conversions_df.to_csv('data/raw_conversions.csv', index=False)
+write_csv(impressions_df, 'data/raw_impressions.csv')
+write_csv(clicks_df, 'data/raw_clicks.csv')
+write_csv(conversions_df, 'data/raw_conversions.csv')
 
 print(f"Generated {len(impressions_df)} impressions")
 print(f"Generated {len(clicks_df)} clicks")
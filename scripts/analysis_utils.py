@@ -11,10 +11,86 @@ This module contains utility functions for:
 import pandas as pd
 import numpy as np
 from scipy import stats
-from sklearn.preprocessing import MinMaxScaler
-from sklearn.metrics import mean_squared_error, mean_absolute_error
-import matplotlib.pyplot as plt
-import seaborn as sns
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import numexpr as ne
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
+
+# Below this many rows a BLAS matrix-vector product beats numexpr's setup cost
+NUMEXPR_MIN_ROWS = 100_000
+
+# Two-sided 95% critical value of the standard normal
+Z_CRITICAL_95 = stats.norm.ppf(0.975)
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, error_model='numpy')
+    def _time_decay_kernel(offsets, timestamps_ns, conversion_ns, values, decay_rate):
+        """Time-decay attributed value per row for a journey sorted by user"""
+        nat = np.iinfo(np.int64).min
+        day_ns = 86400 * 10**9
+        attributed = np.empty(values.shape[0])
+        
+        for g in range(offsets.shape[0] - 1):
+            start, end = offsets[g], offsets[g + 1]
+            if end - start == 1:
+                attributed[start] = values[start]
+                continue
+            
+            max_time = nat
+            for i in range(start, end):
+                if conversion_ns[i] > max_time:
+                    max_time = conversion_ns[i]
+            
+            total_weight = 0.0
+            for i in range(start, end):
+                if max_time == nat or timestamps_ns[i] == nat:
+                    attributed[i] = np.nan
+                    continue
+                weight = np.exp(-((max_time - timestamps_ns[i]) // day_ns) / decay_rate)
+                attributed[i] = weight
+                total_weight += weight
+            
+            for i in range(start, end):
+                attributed[i] = values[i] * attributed[i] / total_weight
+        
+        return attributed
+
+
+def _time_decay_values(offsets, timestamps_ns, conversion_ns, values, decay_rate):
+    """NumPy equivalent of _time_decay_kernel, reducing over each user's rows with reduceat"""
+    nat = np.iinfo(np.int64).min
+    day_ns = 86400 * 10**9
+    starts, touchpoints = offsets[:-1], np.diff(offsets)
+    
+    # Calculate days from each user's conversion (NaN where either timestamp is missing)
+    max_time = np.repeat(np.maximum.reduceat(conversion_ns, starts), touchpoints)
+    missing = (max_time == nat) | (timestamps_ns == nat)
+    days_to_conversion = np.where(missing, np.nan, (max_time - timestamps_ns) // day_ns)
+    
+    # Apply exponential decay, normalised to sum to 1 per user (single-touch journeys get full credit)
+    time_weight = np.exp(-days_to_conversion / decay_rate)
+    total_weight = np.repeat(np.add.reduceat(np.nan_to_num(time_weight), starts), touchpoints)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        time_weight = np.where(np.repeat(touchpoints == 1, touchpoints), 1.0, time_weight / total_weight)
+    return values * time_weight
+
+def _pareto_scan(values, threshold):
+    """Descending order, cumulative percentages and count within threshold.
+    
+    values holds one total per entity, so a handful of NumPy calls beats dispatching a jitted kernel.
+    """
+    order = np.argsort(-values, kind='mergesort')
+    cumulative_pct = np.cumsum(values[order])
+    cumulative_pct *= 100.0 / cumulative_pct[-1]
+    return order, cumulative_pct, np.searchsorted(cumulative_pct, threshold, side='right')
 
 class ChannelAnalyzer:
     """Advanced analytics for channel performance"""
@@ -23,27 +99,45 @@ class ChannelAnalyzer:
         self.attribution_results = {}
         self.optimization_results = {}
     
-    def pareto_analysis(self, df, value_col='revenue', entity_col='channel'):
+    def pareto_analysis(self, df, value_col='revenue', entity_col='channel', engine='pandas'):
         """
         Perform Pareto analysis to identify top performing entities
         Returns the 80/20 breakdown
+        
+        engine='polars' runs the groupby-sum through Polars' lazy engine
         """
         
         # Calculate total value by entity
-        entity_values = df.groupby(entity_col)[value_col].sum().sort_values(ascending=False)
+        if self._use_polars(engine):
+            import polars as pl
+            
+            entity_totals = (
+                pl.from_pandas(df[[entity_col, value_col]]).lazy()
+                .group_by(entity_col)
+                .agg(pl.col(value_col).sum())
+                .collect()
+                .to_pandas()
+                .set_index(entity_col)[value_col]
+            )
+        else:
+            entity_totals = df.groupby(entity_col, observed=True)[value_col].sum()
         
-        # Calculate cumulative percentage
-        total_value = entity_values.sum()
-        entity_values_pct = (entity_values / total_value * 100).cumsum()
+        # Sort, cumulative percentage and 80% cut on the aggregated array
+        order, cumulative_pct, top_entity_count = _pareto_scan(
+            entity_totals.to_numpy(dtype=np.float64), 80.0
+        )
+        top_entity_count = int(top_entity_count)
         
-        # Find entities that contribute to 80% of value
-        top_entities = entity_values_pct[entity_values_pct <= 80].index
+        # Only the final results are wrapped back into pandas objects
+        entity_index = entity_totals.index[order]
+        entity_values = pd.Series(entity_totals.to_numpy()[order], index=entity_index, name=value_col)
+        entity_values_pct = pd.Series(cumulative_pct, index=entity_index, name=value_col)
+        top_entities = entity_index[:top_entity_count]
         
         # Calculate statistics
-        top_entity_count = len(top_entities)
         total_entity_count = len(entity_values)
         top_entity_percentage = (top_entity_count / total_entity_count) * 100
-        top_entity_value_percentage = entity_values_pct.iloc[top_entity_count - 1]
+        top_entity_value_percentage = cumulative_pct[top_entity_count - 1]
         
         return {
             'top_entities': top_entities.tolist(),
@@ -55,49 +149,110 @@ class ChannelAnalyzer:
             'cumulative_percentages': entity_values_pct
         }
     
-    def calculate_efficiency_scores(self, df):
+    def calculate_efficiency_scores(self, df, engine='pandas'):
         """
         Calculate efficiency scores for each channel using multiple metrics
-        """
-        
-        # Group by channel and calculate metrics
-        channel_metrics = df.groupby('channel').agg({
-            'cost': 'sum',
-            'revenue': 'sum',
-            'conversions': 'sum',
-            'clicks': 'sum',
-            'impressions': 'count'
-        })
         
-        # Calculate derived metrics
-        channel_metrics['roas'] = channel_metrics['revenue'] / channel_metrics['cost']
-        channel_metrics['cost_per_conversion'] = channel_metrics['cost'] / channel_metrics['conversions']
-        channel_metrics['conversion_rate'] = channel_metrics['conversions'] / channel_metrics['clicks']
-        channel_metrics['ctr'] = channel_metrics['clicks'] / channel_metrics['impressions']
-        
-        # Normalize metrics for scoring (higher is better)
-        scaler = MinMaxScaler()
+        engine='polars' computes the channel aggregates and ratios in a single
+        Polars lazy query
+        """
         
-        # For metrics where lower is better, invert them
-        channel_metrics['cost_efficiency'] = 1 / channel_metrics['cost_per_conversion']
+        if self._use_polars(engine):
+            channel_metrics = self._channel_metrics_polars(df)
+        else:
+            channel_metrics = self._channel_metrics_pandas(df)
         
         # Select metrics for scoring
         scoring_metrics = ['roas', 'cost_efficiency', 'conversion_rate', 'ctr']
+        X = channel_metrics[scoring_metrics].to_numpy(dtype=np.float64)
         
-        # Normalize scores
-        normalized_scores = pd.DataFrame(
-            scaler.fit_transform(channel_metrics[scoring_metrics]),
-            index=channel_metrics.index,
-            columns=scoring_metrics
-        )
+        # Min-max normalize scores (higher is better); constant metrics scale to 0
+        X_min = np.nanmin(X, axis=0)
+        X_range = np.nanmax(X, axis=0) - X_min
+        X_range[X_range == 0] = 1.0
+        X = (X - X_min) / X_range
         
         # Calculate composite efficiency score
         weights = {'roas': 0.4, 'cost_efficiency': 0.3, 'conversion_rate': 0.2, 'ctr': 0.1}
-        normalized_scores['efficiency_score'] = sum(
-            normalized_scores[metric] * weight for metric, weight in weights.items()
-        )
+        if NUMEXPR_AVAILABLE and len(X) >= NUMEXPR_MIN_ROWS:
+            # One fused pass over the columns instead of a temporary per term
+            expression = ' + '.join(f'{weight} * {metric}' for metric, weight in weights.items())
+            channel_metrics['efficiency_score'] = ne.evaluate(
+                expression, local_dict=dict(zip(scoring_metrics, X.T))
+            )
+        else:
+            channel_metrics['efficiency_score'] = X @ np.array([weights[m] for m in scoring_metrics])
         
-        return channel_metrics.join(normalized_scores[['efficiency_score']])
+        return channel_metrics
+    
+    def _use_polars(self, engine):
+        """Resolve the engine argument of the aggregation methods; polars is only imported when requested"""
+        if engine not in ('pandas', 'polars'):
+            raise ValueError(f"Unknown engine '{engine}', expected 'pandas' or 'polars'")
+        if engine == 'pandas':
+            return False
+        
+        try:
+            import polars  # noqa: F401
+        except ImportError:
+            raise ImportError("engine='polars' requires the polars package") from None
+        return True
+    
+    def _channel_metrics_pandas(self, df):
+        """Channel totals and derived ratios with a pandas groupby"""
+        
+        # Group by channel and calculate metrics
+        channel_metrics = df.groupby('channel', observed=True).agg(
+            cost=('cost', 'sum'),
+            revenue=('revenue', 'sum'),
+            conversions=('conversions', 'sum'),
+            clicks=('clicks', 'sum'),
+            impressions=('impressions', 'count')
+        )
+        cost, revenue, conversions, clicks, impressions = channel_metrics.to_numpy(dtype=np.float64).T
+        
+        # Calculate derived metrics in one block; for metrics where lower
+        # is better (cost per conversion), score on the inverse
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cost_per_conversion = cost / conversions
+            derived = np.column_stack([
+                revenue / cost,
+                cost_per_conversion,
+                conversions / clicks,
+                clicks / impressions,
+                1 / cost_per_conversion
+            ])
+        derived_metrics = ['roas', 'cost_per_conversion', 'conversion_rate', 'ctr', 'cost_efficiency']
+        channel_metrics[derived_metrics] = derived
+        
+        return channel_metrics
+    
+    def _channel_metrics_polars(self, df):
+        """Channel totals and derived ratios as one fused Polars query"""
+        import polars as pl
+        
+        columns = ['channel', 'cost', 'revenue', 'conversions', 'clicks', 'impressions']
+        channel_metrics = (
+            pl.from_pandas(df[columns]).lazy()
+            .group_by('channel')
+            .agg(
+                pl.col('cost').sum(),
+                pl.col('revenue').sum(),
+                pl.col('conversions').sum(),
+                pl.col('clicks').sum(),
+                pl.col('impressions').count().cast(pl.Int64)
+            )
+            .with_columns(
+                (pl.col('revenue') / pl.col('cost')).alias('roas'),
+                (pl.col('cost') / pl.col('conversions')).alias('cost_per_conversion'),
+                (pl.col('conversions') / pl.col('clicks')).alias('conversion_rate'),
+                (pl.col('clicks') / pl.col('impressions')).alias('ctr'),
+                (pl.col('conversions') / pl.col('cost')).alias('cost_efficiency')
+            )
+            .sort('channel')
+            .collect()
+        )
+        return channel_metrics.to_pandas().set_index('channel')
     
     def budget_optimization(self, channel_metrics, total_budget, min_budget_pct=0.05):
         """
@@ -113,25 +268,30 @@ class ChannelAnalyzer:
         
         # Calculate optimal allocation based on efficiency scores
         efficiency_weights = channel_metrics['efficiency_score'] / channel_metrics['efficiency_score'].sum()
-        optimal_allocation = efficiency_weights * total_budget
         
-        # Apply minimum budget constraint
+        # Apply minimum budget constraint by water-filling: visit channels in
+        # ascending weight order and pin them at the floor until the
+        # proportional share of the remaining budget clears it
         min_budget = total_budget * min_budget_pct
+        weights = efficiency_weights.to_numpy()
+        order = np.argsort(weights, kind='stable')
+        sorted_weights = weights[order]
+        remaining_weights = np.cumsum(sorted_weights[::-1])[::-1]
+        remaining_budget = total_budget - np.arange(len(weights)) * min_budget
+        
+        # First channel whose share of the remaining budget clears the floor;
+        # every heavier channel after it clears it too
+        clears_min = remaining_budget * sorted_weights / remaining_weights >= min_budget
+        pivot = int(np.argmax(clears_min)) if clears_min.any() else len(weights)
+        
+        sorted_allocation = np.full(len(weights), min_budget)
+        if pivot < len(weights):
+            sorted_allocation[pivot:] = (
+                remaining_budget[pivot] * sorted_weights[pivot:] / remaining_weights[pivot]
+            )
         
-        # Adjust for minimum constraints
-        channels_below_min = optimal_allocation < min_budget
-        if channels_below_min.any():
-            # Set minimum budget for channels below threshold
-            optimal_allocation[channels_below_min] = min_budget
-            
-            # Redistribute remaining budget among other channels
-            remaining_budget = total_budget - (channels_below_min.sum() * min_budget)
-            remaining_channels = ~channels_below_min
-            
-            if remaining_channels.any():
-                remaining_weights = efficiency_weights[remaining_channels]
-                remaining_weights = remaining_weights / remaining_weights.sum()
-                optimal_allocation[remaining_channels] = remaining_weights * remaining_budget
+        optimal_allocation = pd.Series(np.empty(len(weights)), index=efficiency_weights.index)
+        optimal_allocation.iloc[order] = sorted_allocation
         
         # Calculate expected improvement
         allocation_change = optimal_allocation - current_allocation
@@ -177,78 +337,99 @@ class ChannelAnalyzer:
         Compare different attribution models
         """
         
-        models = {
-            'last_touch': self._last_touch_attribution,
-            'first_touch': self._first_touch_attribution,
-            'linear': self._linear_attribution,
-            'time_decay': self._time_decay_attribution
-        }
-        
-        results = {}
+        # Sort by user once; every order-dependent model reuses the sort and the user offsets
+        df_sorted = journey_df.sort_values(['user_id', 'timestamp'])
+        offsets = self._user_offsets(df_sorted)
         
-        for model_name, model_func in models.items():
-            attributed_value = model_func(journey_df, conversion_value_col)
-            results[model_name] = attributed_value
+        results = {
+            'last_touch': self._last_touch_attribution(df_sorted, conversion_value_col),
+            'first_touch': self._first_touch_attribution(df_sorted, conversion_value_col, offsets=offsets),
+            'linear': self._linear_attribution(df_sorted, conversion_value_col, offsets=offsets),
+            'time_decay': self._time_decay_attribution(df_sorted, conversion_value_col, offsets=offsets)
+        }
         
-        # Create comparison dataframe
+        # Create comparison dataframe from one (channels x models) array
+        model_names = list(results.keys())
         comparison_df = pd.DataFrame(results)
-        comparison_df['variance'] = comparison_df.var(axis=1)
-        comparison_df['mean_attribution'] = comparison_df[list(models.keys())].mean(axis=1)
+        A = comparison_df.to_numpy(dtype=np.float64)
+        comparison_df['variance'] = np.nanvar(A, axis=1, ddof=1)
+        comparison_df['mean_attribution'] = np.nanmean(A, axis=1)
+        
+        if np.isnan(A).any():
+            # Channels missing from a model need pairwise-complete correlation
+            correlation_matrix = comparison_df[model_names].corr()
+        else:
+            correlation_matrix = pd.DataFrame(np.corrcoef(A, rowvar=False), index=model_names, columns=model_names)
         
         self.attribution_results = {
             'model_results': results,
             'comparison': comparison_df,
-            'correlation_matrix': comparison_df[list(models.keys())].corr()
+            'correlation_matrix': correlation_matrix
         }
         
         return self.attribution_results
     
     def _last_touch_attribution(self, df, value_col):
         """Last-touch attribution model"""
-        return df.groupby('channel').agg({value_col: 'sum'})
+        return df.groupby('channel', observed=True)[value_col].sum()
+    
+    def _user_offsets(self, df_sorted):
+        """Start row of each user's touchpoints in a journey sorted by user, followed by the row count"""
+        user_ids = df_sorted['user_id'].to_numpy()
+        if len(user_ids) == 0:
+            return np.zeros(1, dtype=np.int64)
+        
+        boundaries = np.flatnonzero(user_ids[1:] != user_ids[:-1]) + 1
+        return np.concatenate(([0], boundaries, [len(user_ids)])).astype(np.int64)
+    
+    def _sorted_by_user(self, df, offsets):
+        """df sorted by (user_id, timestamp) with its user offsets; passed offsets mean df is already sorted"""
+        if offsets is None:
+            df = df.sort_values(['user_id', 'timestamp'])
+            offsets = self._user_offsets(df)
+        return df, offsets
     
-    def _first_touch_attribution(self, df, value_col):
+    def _first_touch_attribution(self, df, value_col, offsets=None):
         """First-touch attribution model"""
-        # Assuming user journey is sorted by timestamp
-        first_touch = df.groupby('user_id').first()
-        return first_touch.groupby('channel').agg({value_col: 'sum'})
+        df, offsets = self._sorted_by_user(df, offsets)
+        starts = offsets[:-1]
+        
+        # Credit each user's first recorded conversion value to their first touch
+        n_rows = len(df)
+        values = df[value_col].to_numpy()
+        positions = np.where(df[value_col].notna().to_numpy(), np.arange(n_rows), n_rows)
+        first_recorded = np.minimum.reduceat(positions, starts)
+        first_value = np.where(first_recorded < n_rows, values[np.minimum(first_recorded, n_rows - 1)], np.nan)
+        
+        first_touch = pd.DataFrame({'channel': df['channel'].array[starts], value_col: first_value})
+        return first_touch.groupby('channel', observed=True)[value_col].sum()
     
-    def _linear_attribution(self, df, value_col):
+    def _linear_attribution(self, df, value_col, offsets=None):
         """Linear attribution model"""
+        df, offsets = self._sorted_by_user(df, offsets)
+        
         # Equal weight to all touchpoints in a user's journey
-        user_touchpoint_counts = df.groupby('user_id')['channel'].count()
-        df_attributed = df.copy()
-        df_attributed['attributed_value'] = df_attributed.apply(
-            lambda row: row[value_col] / user_touchpoint_counts[row['user_id']], axis=1
-        )
-        return df_attributed.groupby('channel')['attributed_value'].sum()
+        touchpoints = np.diff(offsets)
+        user_touchpoint_counts = np.add.reduceat(df['channel'].notna().to_numpy(), offsets[:-1])
+        attributed_value = df[value_col].to_numpy() / np.repeat(user_touchpoint_counts, touchpoints)
+        attributed_value = pd.Series(attributed_value, index=df.index, name='attributed_value')
+        return attributed_value.groupby(df['channel'], observed=True).sum()
     
-    def _time_decay_attribution(self, df, value_col, decay_rate=7):
+    def _time_decay_attribution(self, df, value_col, offsets=None, decay_rate=7):
         """Time-decay attribution model"""
-        df_sorted = df.sort_values(['user_id', 'timestamp'])
+        df, offsets = self._sorted_by_user(df, offsets)
         
-        def calculate_time_weights(group):
-            if len(group) == 1:
-                group['time_weight'] = 1.0
-                return group
-            
-            # Calculate days from conversion
-            max_time = group['conversion_timestamp'].max()
-            group['days_to_conversion'] = (max_time - group['timestamp']).dt.days
-            
-            # Apply exponential decay
-            group['time_weight'] = np.exp(-group['days_to_conversion'] / decay_rate)
-            
-            # Normalize weights to sum to 1 per user
-            total_weight = group['time_weight'].sum()
-            group['time_weight'] = group['time_weight'] / total_weight
-            
-            return group
+        timestamps_ns = df['timestamp'].to_numpy(dtype='datetime64[ns]').view('i8')
+        conversion_ns = df['conversion_timestamp'].to_numpy(dtype='datetime64[ns]').view('i8')
+        values = df[value_col].to_numpy(dtype=np.float64)
         
-        df_weighted = df_sorted.groupby('user_id').apply(calculate_time_weights)
-        df_weighted['attributed_value'] = df_weighted[value_col] * df_weighted['time_weight']
+        if NUMBA_AVAILABLE:
+            attributed_value = _time_decay_kernel(offsets, timestamps_ns, conversion_ns, values, float(decay_rate))
+        else:
+            attributed_value = _time_decay_values(offsets, timestamps_ns, conversion_ns, values, decay_rate)
         
-        return df_weighted.groupby('channel')['attributed_value'].sum()
+        attributed_value = pd.Series(attributed_value, index=df.index, name='attributed_value')
+        return attributed_value.groupby(df['channel'], observed=True).sum()
     
     def statistical_significance_test(self, control_metrics, treatment_metrics, metric='conversion_rate'):
         """
@@ -258,21 +439,25 @@ class ChannelAnalyzer:
         control_values = control_metrics[metric]
         treatment_values = treatment_metrics[metric]
         
-        # Perform t-test
-        t_stat, p_value = stats.ttest_ind(control_values, treatment_values)
+        # Summary statistics, one pass over each group
+        n1, n2 = len(control_values), len(treatment_values)
+        m1, m2 = control_values.mean(), treatment_values.mean()
+        v1, v2 = control_values.var(ddof=1), treatment_values.var(ddof=1)
         
-        # Calculate effect size (Cohen's d)
-        pooled_std = np.sqrt(((len(control_values) - 1) * control_values.var() + 
-                             (len(treatment_values) - 1) * treatment_values.var()) / 
-                             (len(control_values) + len(treatment_values) - 2))
+        # Perform t-test (pooled variance) from the cached statistics
+        t_stat, p_value = stats.ttest_ind_from_stats(
+            m1, np.sqrt(v1), n1, m2, np.sqrt(v2), n2, equal_var=True
+        )
         
-        cohens_d = (treatment_values.mean() - control_values.mean()) / pooled_std
+        # Calculate effect size (Cohen's d)
+        pooled_std = np.sqrt(((n1 - 1) * v1 + (n2 - 1) * v2) / (n1 + n2 - 2))
+        diff_mean = m2 - m1
+        cohens_d = diff_mean / pooled_std
         
         # Calculate confidence interval for the difference
-        diff_mean = treatment_values.mean() - control_values.mean()
-        diff_se = pooled_std * np.sqrt(1/len(control_values) + 1/len(treatment_values))
-        ci_lower = diff_mean - 1.96 * diff_se
-        ci_upper = diff_mean + 1.96 * diff_se
+        diff_se = pooled_std * np.sqrt(1/n1 + 1/n2)
+        ci_lower = diff_mean - Z_CRITICAL_95 * diff_se
+        ci_upper = diff_mean + Z_CRITICAL_95 * diff_se
         
         return {
             't_statistic': t_stat,
@@ -281,8 +466,8 @@ class ChannelAnalyzer:
             'effect_size_cohens_d': cohens_d,
             'mean_difference': diff_mean,
             'confidence_interval': (ci_lower, ci_upper),
-            'control_mean': control_values.mean(),
-            'treatment_mean': treatment_values.mean()
+            'control_mean': m1,
+            'treatment_mean': m2
         }
 
 class ReportGenerator:
@@ -293,6 +478,7 @@ class ReportGenerator:
     
     def create_channel_performance_report(self, channel_metrics):
         """Create comprehensive channel performance report"""
+        import matplotlib.pyplot as plt
         
         fig, axes = plt.subplots(2, 2, figsize=(15, 12))
         fig.suptitle('Channel Performance Analysis', fontsize=16, fontweight='bold')
@@ -331,6 +517,8 @@ class ReportGenerator:
     
     def create_attribution_comparison_chart(self, attribution_results):
         """Create attribution model comparison chart"""
+        import matplotlib.pyplot as plt
+        import seaborn as sns
         
         comparison_df = attribution_results['comparison']
         models = [col for col in comparison_df.columns if col not in ['variance', 'mean_attribution']]
@@ -355,6 +543,7 @@ class ReportGenerator:
     
     def create_budget_optimization_report(self, optimization_results):
         """Create budget optimization report"""
+        import matplotlib.pyplot as plt
         
         summary = optimization_results['reallocation_summary']
         
@@ -11,30 +11,530 @@ This module contains utility functions for:
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+import json
 import logging
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Column types for the raw files; timestamps are parsed by the CSV reader
+RAW_COLUMN_TYPES = {
+    'raw_impressions.csv': {
+        'impression_id': 'string', 'user_id': 'string', 'campaign_id': 'string',
+        'ad_placement': 'string', 'timestamp': 'timestamp', 'cost': 'float64'
+    },
+    'raw_clicks.csv': {
+        'click_id': 'string', 'impression_id': 'string', 'user_id': 'string',
+        'campaign_id': 'string', 'ad_placement': 'string', 'click_timestamp': 'timestamp'
+    },
+    'raw_conversions.csv': {
+        'conversion_id': 'string', 'click_id': 'string', 'user_id': 'string',
+        'campaign_id': 'string', 'ad_placement': 'string', 'conversion_timestamp': 'timestamp'
+    }
+}
+
+# Worker processes only pay for pickling the frames both ways when the stages
+# that would overlap with the largest one are at least this many rows
+PARALLEL_CLEAN_MIN_ROWS = 5_000_000
+
+# Loading the compiled channel-totals kernel costs about as much as np.bincount
+# spends on this many journey rows, so smaller journeys use _channel_totals
+CHANNEL_TOTALS_KERNEL_MIN_ROWS = 5_000_000
+
+# Raw input file of each cleaned stage
+RAW_FILES = {
+    'impressions': 'raw_impressions.csv',
+    'clicks': 'raw_clicks.csv',
+    'conversions': 'raw_conversions.csv'
+}
+
+# Bump when the cleaning logic changes so existing Parquet caches are rebuilt
+CACHE_VERSION = 5
+CACHE_MANIFEST = 'manifest.json'
+
+# Canonical spelling of the known channels, keyed by their stripped lower-case form
+CHANNEL_NAMES = {
+    name.lower(): name for name in [
+        'Google Search', 'Facebook', 'Instagram', 'TikTok', 'YouTube',
+        'Display Network', 'Campus Radio', 'Campus TV'
+    ]
+}
+
+# Columns that are guaranteed non-null once each stage has been validated
+REQUIRED_COLUMNS = {
+    'impressions': ['impression_id', 'user_id', 'channel', 'timestamp', 'cost'],
+    'clicks': ['click_id', 'impression_id', 'user_id', 'click_timestamp'],
+    'conversions': ['conversion_id', 'click_id', 'user_id', 'conversion_timestamp', 'conversion_value']
+}
+
+# Prefixes of the event ids in the raw files; they are held as integers while processing.
+# Every id is written with exactly ID_WIDTH digits, which is what lets parse_ids read them fixed-width
+ID_PREFIXES = {'impression_id': 'imp_', 'click_id': 'click_', 'conversion_id': 'conv_'}
+ID_WIDTH = 8
+
+# NaT in the int64 view of a datetime64 array
+NAT_NS = np.iinfo(np.int64).min
+
+def parse_ids(ids, prefix, width=ID_WIDTH):
+    """Integer part of prefixed string ids (imp_00000042 -> 42).
+    
+    Only prefix plus exactly width digits, the form format_ids writes, is accepted; anything
+    else is malformed and becomes <NA>, so imp_1 cannot collide with imp_00000001. The digits
+    are read as fixed-width characters, on the Arrow buffers when pyarrow is installed.
+    """
+    n_chars = len(prefix) + width
+    
+    if PYARROW_AVAILABLE:
+        strings = pa.array(ids)
+        if strings.null_count == len(strings):
+            # An all-missing column carries no string type to infer
+            strings = strings.cast(pa.string())
+        digits = pc.utf8_slice_codeunits(strings, len(prefix))
+        canonical = pc.and_(
+            pc.and_(pc.starts_with(strings, prefix), pc.equal(pc.utf8_length(strings), n_chars)),
+            pc.ascii_is_decimal(digits)
+        )
+        numbers = pc.cast(pc.if_else(canonical, digits, None), pa.int64())
+        numbers = numbers.to_pandas(types_mapper={pa.int64(): pd.Int64Dtype()}.get)
+        return pd.Series(numbers.array, index=ids.index, name=ids.name)
+    
+    # One UCS4 code point per column; the extra column is non-zero for over-long ids
+    chars = ids.to_numpy(dtype=f'U{n_chars + 1}', na_value='').view(np.uint32).reshape(-1, n_chars + 1)
+    digits = chars[:, len(prefix):n_chars].astype(np.int64) - ord('0')
+    canonical = (
+        (chars[:, :len(prefix)] == np.array([ord(c) for c in prefix], dtype=np.uint32)).all(axis=1) &
+        ((digits >= 0) & (digits <= 9)).all(axis=1) &
+        (chars[:, n_chars] == 0)
+    )
+    numbers = digits @ 10 ** np.arange(width - 1, -1, -1)
+    return pd.Series(pd.arrays.IntegerArray(numbers, ~canonical), index=ids.index, name=ids.name)
+
+def format_ids(prefix, numbers, width=ID_WIDTH):
+    """Zero-padded string ids (e.g. imp_00000042), the inverse of parse_ids; missing numbers stay missing.
+    
+    Numbers that do not fit in width digits raise ValueError instead of widening the id.
+    """
+    numbers = pd.array(numbers, dtype='Int64')
+    missing = numbers.isna()
+    values = numbers.to_numpy(dtype=np.int64, na_value=0)
+    if ((values < 0) | (values >= 10 ** width)).any():
+        raise ValueError(f"'{prefix}' ids must be between 0 and {10 ** width - 1} to fit in {width} digits")
+    
+    # Build the ids as a fixed-width UCS4 array, one column per character
+    chars = np.empty((len(values), len(prefix) + width), dtype=np.uint32)
+    chars[:, :len(prefix)] = [ord(c) for c in prefix]
+    chars[:, len(prefix):] = values[:, None] // 10 ** np.arange(width - 1, -1, -1) % 10 + ord('0')
+    ids = chars.view(f'U{chars.shape[1]}').ravel()
+    
+    return np.where(missing, None, ids) if missing.any() else ids
+
+def normalize_labels(values, canonical=None):
+    """Strip and lower-case the labels of a categorical Series.
+    
+    With canonical, known labels take its spelling and unknown ones are
+    title-cased. The string work runs once per category, not once per row.
+    """
+    labels = values.cat.categories.str.strip().str.lower()
+    if canonical is not None:
+        labels = labels.map(lambda label: canonical.get(label, label.title()))
+    
+    # Labels that differ only in case or whitespace collapse into one category
+    categories, remap = np.unique(np.asarray(labels, dtype=object), return_inverse=True)
+    # The trailing -1 keeps missing values (code -1) missing, even with no categories at all
+    codes = np.append(remap, -1)[values.cat.codes.to_numpy()]
+    
+    return pd.Series(
+        pd.Categorical.from_codes(codes, categories=categories), index=values.index, name=values.name
+    )
+
+def frame_stats(df, null_counts=None):
+    """Record count, null counts and dtypes of a frame.
+    
+    Null counts already known from cleaning are taken from null_counts; other columns
+    are counted here unless their dtype cannot hold missing values.
+    """
+    known = null_counts or {}
+    counts = {}
+    for col in df.columns:
+        if col in known:
+            counts[col] = int(known[col])
+        elif isinstance(df[col].dtype, np.dtype) and df[col].dtype.kind in 'biu':
+            counts[col] = 0
+        else:
+            counts[col] = int(df[col].isna().sum())
+    
+    return {
+        'record_count': len(df),
+        'null_counts': counts,
+        'data_types': df.dtypes.astype(str).to_dict()
+    }
+
+def elapsed(later, earlier, unit_seconds):
+    """float32 time from earlier to later in units of unit_seconds, NaN where either side is NaT"""
+    # Subtract the raw int64 nanosecond values instead of building a timedelta Series
+    later_ns = later.to_numpy(dtype='datetime64[ns]').view(np.int64)
+    earlier_ns = earlier.to_numpy(dtype='datetime64[ns]').view(np.int64)
+    
+    delay = ((later_ns - earlier_ns) / (unit_seconds * 1e9)).astype(np.float32)
+    delay[(later_ns == NAT_NS) | (earlier_ns == NAT_NS)] = np.nan
+    return delay
+
+def _arrow_csv_options(filename):
+    """pyarrow read and convert options for a raw CSV"""
+    arrow_types = {'string': pa.string(), 'timestamp': pa.timestamp('ns'), 'float64': pa.float64()}
+    return {
+        'read_options': pacsv.ReadOptions(block_size=64 << 20, use_threads=True),
+        'convert_options': pacsv.ConvertOptions(
+            column_types={col: arrow_types[kind] for col, kind in RAW_COLUMN_TYPES[filename].items()},
+            # Empty string cells are missing values, as with pd.read_csv
+            strings_can_be_null=True,
+            quoted_strings_can_be_null=True
+        )
+    }
+
+def read_raw_csv(data_path, filename):
+    """Read a raw CSV, using pyarrow's multi-threaded parser when it is installed"""
+    path = f'{data_path}{filename}'
+    
+    if not PYARROW_AVAILABLE:
+        timestamp_cols = [col for col, kind in RAW_COLUMN_TYPES[filename].items() if kind == 'timestamp']
+        return pd.read_csv(path, parse_dates=timestamp_cols)
+    
+    table = pacsv.read_csv(path, **_arrow_csv_options(filename))
+    return table.to_pandas(self_destruct=True, split_blocks=True)
+
+def iter_raw_csv(data_path, filename, chunksize=1_000_000):
+    """Yield the raw rows of a CSV as DataFrames of chunksize rows (the last may be shorter).
+    
+    This only reads: the cleaning stages deduplicate and take percentiles over a whole
+    stage, so the batches are for inspecting or pre-filtering inputs larger than memory.
+    pyarrow's streaming reader is used when it is installed.
+    """
+    path = f'{data_path}{filename}'
+    
+    if not PYARROW_AVAILABLE:
+        column_types = RAW_COLUMN_TYPES[filename]
+        timestamp_cols = [col for col, kind in column_types.items() if kind == 'timestamp']
+        dtypes = {
+            col: (str if kind == 'string' else kind)
+            for col, kind in column_types.items() if kind != 'timestamp'
+        }
+        yield from pd.read_csv(path, dtype=dtypes, parse_dates=timestamp_cols, chunksize=chunksize)
+        return
+    
+    # Arrow's batches follow the block size, so they are regrouped into chunksize rows
+    reader = pacsv.open_csv(path, **_arrow_csv_options(filename))
+    pending = pa.Table.from_batches([], schema=reader.schema)
+    for batch in reader:
+        pending = pa.concat_tables([pending, pa.Table.from_batches([batch])])
+        while pending.num_rows >= chunksize:
+            yield pending.slice(0, chunksize).to_pandas()
+            pending = pending.slice(chunksize)
+    if pending.num_rows:
+        yield pending.to_pandas()
+
+# Low-cardinality columns stored as category so groupby and merge work on integer codes
+CATEGORICAL_COLUMNS = {
+    'impressions': ['channel', 'device_type', 'audience_segment', 'creative_type'],
+    'clicks': ['channel', 'device_type', 'audience_segment'],
+    'conversions': ['channel', 'conversion_type', 'device_type', 'audience_segment']
+}
+
+def _channel_totals(codes, n_groups, has_impression, has_click, has_conversion, cost, revenue):
+    """Per-group presence counts and NaN-skipping float64 sums, ignoring rows with code -1"""
+    valid = codes >= 0
+    group_codes = codes[valid]
+    
+    totals = np.empty((n_groups, 5))
+    for j, flags in enumerate((has_impression, has_click, has_conversion)):
+        totals[:, j] = np.bincount(group_codes, weights=flags[valid], minlength=n_groups)
+    for j, values in enumerate((cost, revenue), start=3):
+        totals[:, j] = np.bincount(
+            group_codes, weights=np.nan_to_num(values[valid].astype(np.float64)), minlength=n_groups
+        )
+    
+    return totals
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _channel_totals_kernel(codes, n_groups, has_impression, has_click, has_conversion, cost, revenue):
+        """Single-pass equivalent of _channel_totals over the 1-D column arrays"""
+        totals = np.zeros((n_groups, 5))
+        
+        for i in range(codes.shape[0]):
+            g = codes[i]
+            if g < 0:
+                continue
+            totals[g, 0] += has_impression[i]
+            totals[g, 1] += has_click[i]
+            totals[g, 2] += has_conversion[i]
+            if cost[i] == cost[i]:
+                totals[g, 3] += cost[i]
+            if revenue[i] == revenue[i]:
+                totals[g, 4] += revenue[i]
+        
+        return totals
+
+def _float_array(values):
+    """Float ndarray of a Series without copying NumPy float columns; missing values become NaN"""
+    if isinstance(values.dtype, np.dtype) and values.dtype.kind == 'f':
+        return values.to_numpy()
+    return values.to_numpy(dtype=np.float64, na_value=np.nan)
+
+# The cleaning stages are module-level functions so clean_all_data can run them in worker processes
+def _validate_impressions(df):
+    """Validate impressions data"""
+    logger.info("Validating impressions data...")
+    
+    initial_count = len(df)
+    
+    now = np.datetime64(datetime.now())
+    
+    # Keep records with every critical field, a valid cost and no future date,
+    # combined into one mask so the frame is filtered once
+    valid = (
+        df[REQUIRED_COLUMNS['impressions']].notna().all(axis=1) &
+        (df['cost'] >= 0) &
+        (df['timestamp'] <= now)
+    )
+    df = df[valid]
+    
+    removed_count = initial_count - len(df)
+    if removed_count > 0:
+        logger.warning(f"Removed {removed_count} invalid impression records")
+    
+    return df
+
+def _validate_clicks(df):
+    """Validate clicks data"""
+    logger.info("Validating clicks data...")
+    
+    initial_count = len(df)
+    
+    now = np.datetime64(datetime.now())
+    
+    # Keep records with every critical field and no future date
+    valid = (
+        df[REQUIRED_COLUMNS['clicks']].notna().all(axis=1) &
+        (df['click_timestamp'] <= now)
+    )
+    df = df[valid]
+    
+    removed_count = initial_count - len(df)
+    if removed_count > 0:
+        logger.warning(f"Removed {removed_count} invalid click records")
+    
+    return df
+
+def _validate_conversions(df):
+    """Validate conversions data"""
+    logger.info("Validating conversions data...")
+    
+    initial_count = len(df)
+    
+    now = np.datetime64(datetime.now())
+    
+    # Keep records with every critical field and no future date
+    valid = (
+        df[REQUIRED_COLUMNS['conversions']].notna().all(axis=1) &
+        (df['conversion_timestamp'] <= now)
+    )
+    
+    # Remove unrealistic conversion values, with both bounds taken over the valid
+    # records in one percentile call and folded into the same mask
+    valid = valid.to_numpy()
+    values = df['conversion_value'].to_numpy()
+    q1, q99 = np.percentile(values[valid].astype(np.float64), [1, 99]) if valid.any() else (np.nan, np.nan)
+    df = df[valid & (values >= q1) & (values <= q99)]
+    
+    removed_count = initial_count - len(df)
+    if removed_count > 0:
+        logger.warning(f"Removed {removed_count} invalid conversion records")
+    
+    return df
+
+def clean_impressions(df, validate_uniqueness=True):
+    """Clean and preprocess a raw impressions frame"""
+    logger.info("Cleaning impressions data...")
+    
+    # Convert ids and timestamps and extract time features in a single assign
+    timestamp = pd.to_datetime(df['timestamp'])
+    hour = timestamp.dt.hour.astype(np.int8)
+    day_of_week = timestamp.dt.dayofweek.astype(np.int8)
+    df = df.assign(
+        impression_id=parse_ids(df['impression_id'], ID_PREFIXES['impression_id']),
+        timestamp=timestamp,
+        hour=hour,
+        day_of_week=day_of_week,
+        month=timestamp.dt.month.astype(np.int8),
+        is_weekend=day_of_week.isin([5, 6]),
+        is_business_hours=hour.between(9, 17)
+    )
+    
+    # Clean categorical variables on their categories rather than row by row
+    df = df.astype({col: 'category' for col in CATEGORICAL_COLUMNS['impressions']})
+    df['channel'] = normalize_labels(df['channel'], CHANNEL_NAMES)
+    df['device_type'] = normalize_labels(df['device_type'])
+    df['audience_segment'] = normalize_labels(df['audience_segment'])
+    
+    # Handle missing values and store cost as float32
+    df['cost'] = df['cost'].fillna(df['cost'].median()).astype(np.float32)
+    
+    # Remove duplicates
+    if validate_uniqueness:
+        initial_count = len(df)
+        df = df.drop_duplicates(subset=['impression_id'])
+        duplicates_removed = initial_count - len(df)
+        
+        if duplicates_removed > 0:
+            logger.warning(f"Removed {duplicates_removed} duplicate impressions")
+    
+    # Data validation
+    df = _validate_impressions(df)
+    
+    return df
+
+def clean_clicks(df, validate_uniqueness=True):
+    """Clean and preprocess a raw clicks frame"""
+    logger.info("Cleaning clicks data...")
+    
+    # Convert ids and timestamps and extract time features in a single assign
+    click_timestamp = pd.to_datetime(df['click_timestamp'])
+    df = df.assign(
+        click_id=parse_ids(df['click_id'], ID_PREFIXES['click_id']),
+        impression_id=parse_ids(df['impression_id'], ID_PREFIXES['impression_id']),
+        click_timestamp=click_timestamp,
+        click_hour=click_timestamp.dt.hour.astype(np.int8),
+        click_day_of_week=click_timestamp.dt.dayofweek.astype(np.int8)
+    )
+    
+    # Store categorical variables as category
+    df = df.astype({col: 'category' for col in CATEGORICAL_COLUMNS['clicks']})
+    
+    # Remove duplicates
+    if validate_uniqueness:
+        initial_count = len(df)
+        df = df.drop_duplicates(subset=['click_id'])
+        duplicates_removed = initial_count - len(df)
+        
+        if duplicates_removed > 0:
+            logger.warning(f"Removed {duplicates_removed} duplicate clicks")
+    
+    # Data validation
+    df = _validate_clicks(df)
+    
+    return df
+
+def clean_conversions(df, validate_uniqueness=True):
+    """Clean and preprocess a raw conversions frame"""
+    logger.info("Cleaning conversions data...")
+    
+    # Convert ids and timestamps and extract time features in a single assign
+    conversion_timestamp = pd.to_datetime(df['conversion_timestamp'])
+    df = df.assign(
+        conversion_id=parse_ids(df['conversion_id'], ID_PREFIXES['conversion_id']),
+        click_id=parse_ids(df['click_id'], ID_PREFIXES['click_id']),
+        conversion_timestamp=conversion_timestamp,
+        conversion_hour=conversion_timestamp.dt.hour.astype(np.int8),
+        conversion_day_of_week=conversion_timestamp.dt.dayofweek.astype(np.int8)
+    )
+    
+    # Clean conversion values (float32 is ample for currency amounts)
+    df['conversion_value'] = pd.to_numeric(df['conversion_value'], errors='coerce').astype(np.float32)
+    df = df.dropna(subset=['conversion_value'])
+    
+    # Remove negative or zero conversion values
+    df = df[df['conversion_value'] > 0]
+    
+    # Store categorical variables as category
+    df = df.astype({col: 'category' for col in CATEGORICAL_COLUMNS['conversions']})
+    
+    # Remove duplicates
+    if validate_uniqueness:
+        initial_count = len(df)
+        df = df.drop_duplicates(subset=['conversion_id'])
+        duplicates_removed = initial_count - len(df)
+        
+        if duplicates_removed > 0:
+            logger.warning(f"Removed {duplicates_removed} duplicate conversions")
+    
+    # Data validation
+    df = _validate_conversions(df)
+    
+    return df
+
+CLEAN_FUNCTIONS = {
+    'impressions': clean_impressions,
+    'clicks': clean_clicks,
+    'conversions': clean_conversions
+}
+
+def write_csv(df, path):
+    """Write df to CSV, using Arrow's multi-threaded writer when pyarrow is installed"""
+    if not PYARROW_AVAILABLE:
+        df.to_csv(path, index=False)
+        return
+    
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), path)
+
 class DataProcessor:
     """Main data processing class for ad campaign data"""
     
-    def __init__(self):
+    def __init__(self, cache_dir=None, validate_uniqueness=True):
         self.processed_data = {}
+        self.data_path = '../data/'
+        
+        # Ids from a trusted source (e.g. the synthetic generator) are unique by
+        # construction, so the duplicate-id pass can be switched off
+        self.validate_uniqueness = validate_uniqueness
+        
+        # Cleaned stages are cached as Parquet in cache_dir, which needs pyarrow
+        if cache_dir is not None and not PYARROW_AVAILABLE:
+            logger.warning("pyarrow is not installed; Parquet caching is disabled")
+            cache_dir = None
+        self.cache_dir = cache_dir
+        self._cached = {}
+        self._cache_hits = set()
+        
+        # Quality report figures per stage as (frame, stats), recorded as each stage is produced
+        self.stats = {}
         
     def load_raw_data(self, data_path='../data/'):
-        """Load raw data files"""
+        """Load raw data files, skipping any stage whose cleaned cache is still fresh"""
         try:
             logger.info("Loading raw data files...")
             
-            self.impressions_df = pd.read_csv(f'{data_path}raw_impressions.csv')
-            self.clicks_df = pd.read_csv(f'{data_path}raw_clicks.csv')
-            self.conversions_df = pd.read_csv(f'{data_path}raw_conversions.csv')
+            self.data_path = data_path
+            self._cached = {}
+            self._cache_hits = set()
             
-            logger.info(f"Loaded {len(self.impressions_df)} impressions")
-            logger.info(f"Loaded {len(self.clicks_df)} clicks")
-            logger.info(f"Loaded {len(self.conversions_df)} conversions")
+            for key, filename in RAW_FILES.items():
+                cached = self._read_cache(key)
+                if cached is not None:
+                    self._cached[key] = cached
+                    setattr(self, f'{key}_df', None)
+                    logger.info(f"Using cached cleaned {key}: {len(cached)} records")
+                else:
+                    setattr(self, f'{key}_df', read_raw_csv(data_path, filename))
+                    logger.info(f"Loaded {len(getattr(self, f'{key}_df'))} {key}")
             
             return True
             
@@ -44,144 +544,124 @@ class DataProcessor:
     
     def clean_impressions_data(self):
         """Clean and preprocess impressions data"""
-        logger.info("Cleaning impressions data...")
-        
-        df = self.impressions_df.copy()
-        
-        # Convert timestamp columns
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        
-        # Extract time features
-        df['hour'] = df['timestamp'].dt.hour
-        df['day_of_week'] = df['timestamp'].dt.dayofweek
-        df['month'] = df['timestamp'].dt.month
-        df['is_weekend'] = df['day_of_week'].isin([5, 6])
-        df['is_business_hours'] = df['hour'].between(9, 17)
-        
-        # Clean categorical variables
-        df['channel'] = df['channel'].str.strip().str.title()
-        df['device_type'] = df['device_type'].str.lower()
-        df['audience_segment'] = df['audience_segment'].str.lower()
-        
-        # Handle missing values
-        df['cost'] = df['cost'].fillna(df['cost'].median())
-        
-        # Remove duplicates
-        initial_count = len(df)
-        df = df.drop_duplicates(subset=['impression_id'])
-        duplicates_removed = initial_count - len(df)
-        
-        if duplicates_removed > 0:
-            logger.warning(f"Removed {duplicates_removed} duplicate impressions")
-        
-        # Data validation
-        df = self._validate_impressions(df)
-        
-        self.processed_data['impressions'] = df
-        logger.info(f"Cleaned impressions data: {len(df)} records")
-        
-        return df
+        return self._clean_stage('impressions')
     
     def clean_clicks_data(self):
         """Clean and preprocess clicks data"""
-        logger.info("Cleaning clicks data...")
-        
-        df = self.clicks_df.copy()
-        
-        # Convert timestamp columns
-        df['click_timestamp'] = pd.to_datetime(df['click_timestamp'])
-        
-        # Extract time features
-        df['click_hour'] = df['click_timestamp'].dt.hour
-        df['click_day_of_week'] = df['click_timestamp'].dt.dayofweek
-        
-        # Remove duplicates
-        initial_count = len(df)
-        df = df.drop_duplicates(subset=['click_id'])
-        duplicates_removed = initial_count - len(df)
-        
-        if duplicates_removed > 0:
-            logger.warning(f"Removed {duplicates_removed} duplicate clicks")
-        
-        # Data validation
-        df = self._validate_clicks(df)
-        
-        self.processed_data['clicks'] = df
-        logger.info(f"Cleaned clicks data: {len(df)} records")
-        
-        return df
+        return self._clean_stage('clicks')
     
     def clean_conversions_data(self):
         """Clean and preprocess conversions data"""
-        logger.info("Cleaning conversions data...")
-        
-        df = self.conversions_df.copy()
-        
-        # Convert timestamp columns
-        df['conversion_timestamp'] = pd.to_datetime(df['conversion_timestamp'])
-        
-        # Extract time features
-        df['conversion_hour'] = df['conversion_timestamp'].dt.hour
-        df['conversion_day_of_week'] = df['conversion_timestamp'].dt.dayofweek
-        
-        # Clean conversion values
-        df['conversion_value'] = pd.to_numeric(df['conversion_value'], errors='coerce')
-        df = df.dropna(subset=['conversion_value'])
-        
-        # Remove negative or zero conversion values
-        df = df[df['conversion_value'] > 0]
-        
-        # Remove duplicates
-        initial_count = len(df)
-        df = df.drop_duplicates(subset=['conversion_id'])
-        duplicates_removed = initial_count - len(df)
-        
-        if duplicates_removed > 0:
-            logger.warning(f"Removed {duplicates_removed} duplicate conversions")
-        
-        # Data validation
-        df = self._validate_conversions(df)
+        return self._clean_stage('conversions')
+    
+    def clean_all_data(self, max_workers=3):
+        """Clean impressions, clicks and conversions, in worker processes when they are large enough"""
+        pending = []
+        for key in RAW_FILES:
+            if key in self._cached:
+                self._use_cached(key)
+            else:
+                pending.append(key)
+        
+        # Shipping frames to a worker only pays off when stages can overlap
+        sizes = sorted(len(getattr(self, f'{key}_df')) for key in pending)
+        if len(pending) <= 1 or max_workers <= 1 or sizes[-2] < PARALLEL_CLEAN_MIN_ROWS:
+            for key in pending:
+                self._clean_stage(key)
+            return self.processed_data
+        
+        # spawn, not fork: forking after numba's threading layer has started hangs the workers
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers, len(pending)),
+            mp_context=multiprocessing.get_context('spawn')
+        ) as executor:
+            futures = {
+                key: executor.submit(CLEAN_FUNCTIONS[key], self._take_raw(key), self.validate_uniqueness)
+                for key in pending
+            }
+            for key, future in futures.items():
+                self._store_stage(key, future.result())
         
-        self.processed_data['conversions'] = df
-        logger.info(f"Cleaned conversions data: {len(df)} records")
+        return self.processed_data
+    
+    def _clean_stage(self, key):
+        """Clean one stage in this process, or adopt its cached result"""
+        if key in self._cached:
+            return self._use_cached(key)
         
+        return self._store_stage(key, CLEAN_FUNCTIONS[key](self._take_raw(key), self.validate_uniqueness))
+    
+    def _take_raw(self, key):
+        """Hand over a raw frame, dropping the processor's reference so it can be freed after cleaning"""
+        df = getattr(self, f'{key}_df')
+        setattr(self, f'{key}_df', None)
+        return df
+    
+    def _store_stage(self, key, df):
+        """Record a cleaned stage and write it to the cache"""
+        self.processed_data[key] = df
+        
+        # Validation leaves no nulls in the required columns
+        self._record_stats(key, df, dict.fromkeys(REQUIRED_COLUMNS[key], 0))
+        self._write_cache(key, df)
+        logger.info(f"Cleaned {key} data: {len(df)} records")
         return df
     
     def create_user_journey(self):
         """Create user journey data by joining impressions, clicks, and conversions"""
         logger.info("Creating user journey data...")
         
-        # Join impressions with clicks
-        impressions_clicks = pd.merge(
-            self.processed_data['impressions'],
-            self.processed_data['clicks'],
-            on='impression_id',
-            how='left',
-            suffixes=('_imp', '_click')
-        )
-        
-        # Join with conversions
-        full_journey = pd.merge(
-            impressions_clicks,
-            self.processed_data['conversions'],
-            on='click_id',
-            how='left',
-            suffixes=('', '_conv')
+        # The journey is only reused when all three cleaned inputs came from the cache
+        if self._cache_hits >= set(RAW_FILES):
+            cached = self._read_cache('user_journey')
+            if cached is not None:
+                self.processed_data['user_journey'] = cached
+                logger.info(f"Using cached user journey data: {len(cached)} records")
+                return cached
+        
+        # Index the right-hand frames by their join key once, sorted, so both joins
+        # look rows up through the index instead of hashing a key column
+        clicks = self.processed_data['clicks'].set_index('impression_id').sort_index()
+        conversions = self.processed_data['conversions'].set_index('click_id').sort_index()
+        
+        # Join impressions with clicks, then with conversions
+        full_journey = (
+            self.processed_data['impressions']
+            .join(clicks, on='impression_id', how='left', lsuffix='_imp', rsuffix='_click')
+            .join(conversions, on='click_id', how='left', lsuffix='', rsuffix='_conv')
+            .reset_index(drop=True)
         )
         
         # Calculate time differences
-        full_journey['click_delay_minutes'] = (
-            full_journey['click_timestamp'] - full_journey['timestamp']
-        ).dt.total_seconds() / 60
+        full_journey['click_delay_minutes'] = elapsed(
+            full_journey['click_timestamp'], full_journey['timestamp'], 60
+        )
         
-        full_journey['conversion_delay_hours'] = (
-            full_journey['conversion_timestamp'] - full_journey['click_timestamp']
-        ).dt.total_seconds() / 3600
+        full_journey['conversion_delay_hours'] = elapsed(
+            full_journey['conversion_timestamp'], full_journey['click_timestamp'], 3600
+        )
         
         # Flag converted users
         full_journey['converted'] = full_journey['conversion_id'].notna()
         
+        # The journey's null counts follow from its inputs' counts and the rows each join matched
+        n_rows = len(full_journey)
+        n_clicked = int(full_journey['click_id'].notna().sum())
+        n_converted = int(full_journey['converted'].sum())
+        null_counts = self._joined_null_counts(full_journey, [
+            ('impressions', self.processed_data['impressions'].columns, n_rows),
+            ('clicks', clicks.columns, n_clicked),
+            ('conversions', conversions.columns, n_converted)
+        ])
+        null_counts.update(
+            click_delay_minutes=n_rows - n_clicked,
+            conversion_delay_hours=n_rows - n_converted,
+            converted=0
+        )
+        
         self.processed_data['user_journey'] = full_journey
+        self._record_stats('user_journey', full_journey, null_counts)
+        self._write_cache('user_journey', full_journey)
         logger.info(f"Created user journey data: {len(full_journey)} records")
         
         return full_journey
@@ -192,101 +672,155 @@ class DataProcessor:
         
         journey_df = self.processed_data['user_journey']
         
-        channel_metrics = journey_df.groupby('channel_imp').agg({
-            'impression_id': 'count',
-            'click_id': 'count',
-            'conversion_id': 'count',
-            'cost': 'sum',
-            'conversion_value': 'sum'
-        }).reset_index()
-        
-        channel_metrics.columns = ['channel', 'impressions', 'clicks', 'conversions', 'cost', 'revenue']
+        # Aggregate every channel total in one pass over the channel codes, reading the
+        # columns in place; the float32 cost and revenue are accumulated in float64
+        codes, channels = pd.factorize(journey_df['channel_imp'], sort=True)
+        use_kernel = NUMBA_AVAILABLE and len(journey_df) >= CHANNEL_TOTALS_KERNEL_MIN_ROWS
+        aggregate = _channel_totals_kernel if use_kernel else _channel_totals
+        totals = aggregate(
+            codes,
+            len(channels),
+            journey_df['impression_id'].notna().to_numpy(),
+            journey_df['click_id'].notna().to_numpy(),
+            journey_df['conversion_id'].notna().to_numpy(),
+            _float_array(journey_df['cost']),
+            _float_array(journey_df['conversion_value'])
+        )
         
-        # Calculate derived metrics
-        channel_metrics['ctr'] = channel_metrics['clicks'] / channel_metrics['impressions'] * 100
-        channel_metrics['conversion_rate'] = channel_metrics['conversions'] / channel_metrics['clicks'] * 100
-        channel_metrics['cost_per_click'] = channel_metrics['cost'] / channel_metrics['clicks']
-        channel_metrics['cost_per_conversion'] = channel_metrics['cost'] / channel_metrics['conversions']
-        channel_metrics['roas'] = channel_metrics['revenue'] / channel_metrics['cost']
-        channel_metrics['profit'] = channel_metrics['revenue'] - channel_metrics['cost']
+        channel_metrics = pd.DataFrame({
+            'channel': channels,
+            'impressions': totals[:, 0].astype(np.int64),
+            'clicks': totals[:, 1].astype(np.int64),
+            'conversions': totals[:, 2].astype(np.int64),
+            'cost': totals[:, 3],
+            'revenue': totals[:, 4]
+        })
+        
+        # Calculate derived metrics in one eval (fused by numexpr when it is installed)
+        channel_metrics = channel_metrics.eval("""
+            ctr = clicks / impressions * 100
+            conversion_rate = conversions / clicks * 100
+            cost_per_click = cost / clicks
+            cost_per_conversion = cost / conversions
+            roas = revenue / cost
+            profit = revenue - cost
+        """)
         
         # Handle division by zero
         channel_metrics = channel_metrics.replace([np.inf, -np.inf], np.nan)
         
         self.processed_data['channel_metrics'] = channel_metrics
+        self._record_stats('channel_metrics', channel_metrics)
         logger.info("Channel metrics calculated successfully")
         
         return channel_metrics
     
-    def _validate_impressions(self, df):
-        """Validate impressions data"""
-        logger.info("Validating impressions data...")
-        
-        initial_count = len(df)
-        
-        # Remove records with missing critical fields
-        df = df.dropna(subset=['impression_id', 'user_id', 'channel', 'timestamp'])
-        
-        # Remove records with invalid costs
-        df = df[df['cost'] >= 0]
-        
-        # Remove future dates
-        df = df[df['timestamp'] <= datetime.now()]
-        
-        removed_count = initial_count - len(df)
-        if removed_count > 0:
-            logger.warning(f"Removed {removed_count} invalid impression records")
-        
-        return df
+    def _record_stats(self, key, df, null_counts=None):
+        """Record the quality report figures of a stage as it is produced"""
+        self.stats[key] = (df, frame_stats(df, null_counts))
+        return self.stats[key]
     
-    def _validate_clicks(self, df):
-        """Validate clicks data"""
-        logger.info("Validating clicks data...")
-        
-        initial_count = len(df)
-        
-        # Remove records with missing critical fields
-        df = df.dropna(subset=['click_id', 'impression_id', 'user_id', 'click_timestamp'])
-        
-        # Remove future dates
-        df = df[df['click_timestamp'] <= datetime.now()]
-        
-        removed_count = initial_count - len(df)
-        if removed_count > 0:
-            logger.warning(f"Removed {removed_count} invalid click records")
-        
+    def _joined_null_counts(self, journey, parts):
+        """Null counts of journey columns from the inputs joined into it.
+        
+        parts lists (stage, columns, matched rows) in join order. A column without nulls in
+        its input is null exactly on the rows its join left unmatched; only columns whose
+        input already had nulls are counted on the journey itself.
+        """
+        null_counts = {}
+        position = 0
+        for key, columns, matched in parts:
+            input_counts = self.stats[key][1]['null_counts']
+            for col, journey_col in zip(columns, journey.columns[position:position + len(columns)]):
+                if input_counts[col] == 0:
+                    null_counts[journey_col] = len(journey) - matched
+                else:
+                    null_counts[journey_col] = int(journey[journey_col].isna().sum())
+            position += len(columns)
+        
+        return null_counts
+    
+    def _cache_sources(self, key):
+        """Raw files a cached stage is derived from"""
+        if key == 'user_journey':
+            return list(RAW_FILES.values())
+        return [RAW_FILES[key]]
+    
+    def _manifest_entry(self, key):
+        """Manifest record of a stage: cache version, cleaning options and (mtime_ns, size) of each raw input"""
+        inputs = {}
+        for filename in self._cache_sources(key):
+            stat = os.stat(f'{self.data_path}{filename}')
+            inputs[filename] = [stat.st_mtime_ns, stat.st_size]
+        
+        return {'version': CACHE_VERSION, 'validate_uniqueness': self.validate_uniqueness, 'inputs': inputs}
+    
+    def _read_manifest(self):
+        """Load the cache manifest, treating a missing or corrupt file as empty"""
+        try:
+            with open(os.path.join(self.cache_dir, CACHE_MANIFEST)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _read_cache(self, key):
+        """Cached frame for a stage, or None when caching is off or the cache is stale"""
+        if self.cache_dir is None:
+            return None
+        
+        path = os.path.join(self.cache_dir, f'{key}.parquet')
+        entry = dict(self._read_manifest().get(key, {}))
+        null_counts = entry.pop('null_counts', None)
+        if not os.path.exists(path) or entry != self._manifest_entry(key):
+            return None
+        
+        self._cache_hits.add(key)
+        df = pd.read_parquet(path)
+        self._record_stats(key, df, null_counts)
         return df
     
-    def _validate_conversions(self, df):
-        """Validate conversions data"""
-        logger.info("Validating conversions data...")
-        
-        initial_count = len(df)
-        
-        # Remove records with missing critical fields
-        df = df.dropna(subset=['conversion_id', 'click_id', 'user_id', 'conversion_timestamp'])
-        
-        # Remove future dates
-        df = df[df['conversion_timestamp'] <= datetime.now()]
-        
-        # Remove unrealistic conversion values
-        q1 = df['conversion_value'].quantile(0.01)
-        q99 = df['conversion_value'].quantile(0.99)
-        df = df[(df['conversion_value'] >= q1) & (df['conversion_value'] <= q99)]
-        
-        removed_count = initial_count - len(df)
-        if removed_count > 0:
-            logger.warning(f"Removed {removed_count} invalid conversion records")
+    def _write_cache(self, key, df):
+        """Persist a cleaned stage to Parquet and record its inputs and null counts in the manifest"""
+        if self.cache_dir is None:
+            return
+        
+        os.makedirs(self.cache_dir, exist_ok=True)
+        df.to_parquet(
+            os.path.join(self.cache_dir, f'{key}.parquet'),
+            compression='zstd',
+            row_group_size=1 << 20
+        )
         
+        manifest = self._read_manifest()
+        manifest[key] = {**self._manifest_entry(key), 'null_counts': self.stats[key][1]['null_counts']}
+        with open(os.path.join(self.cache_dir, CACHE_MANIFEST), 'w') as f:
+            json.dump(manifest, f, indent=2)
+    
+    def _use_cached(self, key):
+        """Adopt a stage loaded from the cache as the cleaned result"""
+        df = self._cached.pop(key)
+        self.processed_data[key] = df
         return df
     
-    def export_cleaned_data(self, output_path='../data/'):
-        """Export cleaned data to CSV files"""
+    def export_cleaned_data(self, output_path='../data/', file_format='csv'):
+        """Export cleaned data to CSV or zstd-compressed Parquet files"""
+        if file_format not in ('csv', 'parquet'):
+            raise ValueError(f"Unknown file_format '{file_format}', expected 'csv' or 'parquet'")
+        
         logger.info("Exporting cleaned data...")
         
         for key, df in self.processed_data.items():
-            filename = f'{output_path}clean_{key}.csv'
-            df.to_csv(filename, index=False)
+            filename = f'{output_path}clean_{key}.{file_format}'
+            
+            # Restore the prefixed string form of the integer ids
+            df = df.assign(**{
+                col: format_ids(prefix, df[col]) for col, prefix in ID_PREFIXES.items() if col in df
+            })
+            
+            if file_format == 'parquet':
+                df.to_parquet(filename, engine='pyarrow', compression='zstd', row_group_size=1_000_000, index=False)
+            else:
+                write_csv(df, filename)
             logger.info(f"Exported {key} data to {filename}")
     
     def generate_data_quality_report(self):
@@ -298,24 +832,23 @@ class DataProcessor:
             'data_summary': {}
         }
         
+        # Figures were recorded as each stage was produced; only a frame replaced
+        # in processed_data since then is counted here
         for key, df in self.processed_data.items():
-            report['data_summary'][key] = {
-                'record_count': len(df),
-                'null_counts': df.isnull().sum().to_dict(),
-                'data_types': df.dtypes.astype(str).to_dict()
-            }
+            memo = self.stats.get(key)
+            if memo is None or memo[0] is not df:
+                memo = self._record_stats(key, df)
+            report['data_summary'][key] = memo[1]
         
         return report
 
 def main():
     """Main ETL pipeline"""
-    processor = DataProcessor()
+    processor = DataProcessor(cache_dir='../data/cache/')
     
     # Load and clean data
     if processor.load_raw_data():
-        processor.clean_impressions_data()
-        processor.clean_clicks_data()
-        processor.clean_conversions_data()
+        processor.clean_all_data()
         
         # Create enriched datasets
         processor.create_user_journey()
@@ -10,13 +10,93 @@ This script generates synthetic advertising data that mimics real-world scenario
 
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-from faker import Faker
-import random
+from datetime import datetime
 
-fake = Faker()
-np.random.seed(42)
-random.seed(42)
+from etl_utils import ID_PREFIXES, format_ids
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Single seeded generator shared by every draw, for reproducibility
+rng = np.random.default_rng(42)
+
+def with_string_ids(df):
+    """Copy of df with its integer event ids (kept as int64 in memory) formatted for CSV export"""
+    return df.assign(**{
+        col: format_ids(prefix, df[col].to_numpy()) for col, prefix in ID_PREFIXES.items() if col in df
+    })
+
+def weighted_indices(cdf, size):
+    """Indices drawn by inverting a precomputed CDF (the same draws as rng.choice with p)"""
+    return np.searchsorted(cdf, rng.random(size), side='right').astype(np.int8)
+
+def probability_cdf(p):
+    """Normalised cumulative distribution for weighted_indices"""
+    cdf = np.cumsum(p)
+    return cdf / cdf[-1]
+
+def weighted_labels(labels, p, size):
+    """Categorical of labels drawn with probabilities p, carried as int8 codes"""
+    return pd.Categorical.from_codes(weighted_indices(probability_cdf(p), size), categories=labels)
+
+def rate_table(labels, rates, default=None):
+    """Codes of labels into a rate array built from rates.
+    
+    Labels missing from rates take default, stored after the listed rates. Without a
+    default they raise KeyError, since an unknown channel has no sensible base rate.
+    Categorical labels are looked up once per category and mapped through their codes.
+    """
+    index = pd.Index(list(rates), dtype=object)
+    if isinstance(labels.dtype, pd.CategoricalDtype):
+        # The trailing -1 keeps missing labels (code -1) unmatched, even with no categories at all
+        codes = np.append(index.get_indexer(labels.cat.categories), -1)[labels.cat.codes.to_numpy()]
+    else:
+        codes = index.get_indexer(labels)
+    
+    table = np.fromiter(rates.values(), dtype=np.float64)
+    missing = codes < 0
+    if missing.any():
+        if default is None:
+            unknown = pd.unique(np.asarray(labels, dtype=object)[missing])
+            raise KeyError(f"No rate defined for {list(unknown)}")
+        codes = np.where(missing, len(table), codes)
+    if default is not None:
+        table = np.append(table, default)
+    
+    return codes, table
+
+def bernoulli_mask(uniforms, base, *multipliers):
+    """Rows whose uniform draw is below the base rate times every multiplier, each a rate_table result"""
+    base_codes, base_rates = base
+    
+    if NUMBA_AVAILABLE:
+        # Multiplier codes and tables are stacked so the kernel accepts any number of them
+        factor_codes = np.empty((len(multipliers), len(uniforms)), dtype=np.int32)
+        factor_rates = np.ones((len(multipliers), max((len(t) for _, t in multipliers), default=1)))
+        for j, (codes, rates) in enumerate(multipliers):
+            factor_codes[j] = codes
+            factor_rates[j, :len(rates)] = rates
+        return _bernoulli_mask_kernel(uniforms, base_codes, base_rates, factor_codes, factor_rates)
+    
+    rate = base_rates[base_codes]
+    for codes, rates in multipliers:
+        rate = rate * rates[codes]
+    return uniforms < rate
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _bernoulli_mask_kernel(uniforms, base_codes, base_rates, factor_codes, factor_rates):
+        """Multi-threaded bernoulli_mask that never materialises the per-row rate array"""
+        mask = np.empty(uniforms.shape[0], dtype=np.bool_)
+        for i in prange(uniforms.shape[0]):
+            rate = base_rates[base_codes[i]]
+            for j in range(factor_codes.shape[0]):
+                rate *= factor_rates[j, factor_codes[j, i]]
+            mask[i] = uniforms[i] < rate
+        return mask
 
 def generate_ad_impressions(n_impressions=2000000):
     """Generate synthetic ad impression data"""
@@ -33,130 +113,90 @@ def generate_ad_impressions(n_impressions=2000000):
         'Campus TV': {'ctr': 0.012, 'cost_per_impression': 0.18, 'conversion_rate': 0.055}
     }
     
+    channel_names = list(channels.keys())
+    channel_cdf = probability_cdf([0.25, 0.20, 0.15, 0.12, 0.10, 0.08, 0.05, 0.05])
+    base_costs = np.array([c['cost_per_impression'] for c in channels.values()])
+    
     # Generate time series data
     start_date = datetime(2024, 1, 1)
     end_date = datetime(2024, 12, 31)
-    date_range = pd.date_range(start_date, end_date, freq='H')
-    
-    impressions_data = []
-    
-    for i in range(n_impressions):
-        channel = np.random.choice(list(channels.keys()), 
-                                 p=[0.25, 0.20, 0.15, 0.12, 0.10, 0.08, 0.05, 0.05])
-        
-        # Seasonal and time-based patterns
-        timestamp = np.random.choice(date_range)
-        hour = timestamp.hour
-        day_of_week = timestamp.dayofweek
-        
-        # Adjust impressions based on time patterns
-        time_multiplier = 1.0
-        if 9 <= hour <= 17:  # Business hours
-            time_multiplier *= 1.3
-        if day_of_week < 5:  # Weekdays
-            time_multiplier *= 1.2
-        
-        impression = {
-            'impression_id': f'imp_{i:08d}',
-            'user_id': f'user_{np.random.randint(1, 500000):06d}',
-            'channel': channel,
-            'campaign_id': f'camp_{np.random.randint(1, 50):03d}',
-            'ad_placement': f'placement_{np.random.randint(1, 200):03d}',
-            'timestamp': timestamp,
-            'cost': channels[channel]['cost_per_impression'] * np.random.uniform(0.8, 1.2),
-            'device_type': np.random.choice(['mobile', 'desktop', 'tablet'], p=[0.6, 0.3, 0.1]),
-            'audience_segment': np.random.choice(['students', 'faculty', 'staff', 'alumni'], p=[0.5, 0.2, 0.2, 0.1]),
-            'creative_type': np.random.choice(['image', 'video', 'text'], p=[0.5, 0.3, 0.2])
-        }
-        
-        impressions_data.append(impression)
-    
-    return pd.DataFrame(impressions_data)
+    date_range = pd.date_range(start_date, end_date, freq='h')
+    
+    # Draw every column for all impressions at once
+    n = n_impressions
+    channel_idx = weighted_indices(channel_cdf, n)
+    
+    return pd.DataFrame({
+        'impression_id': np.arange(n, dtype=np.int64),
+        'user_id': format_ids('user_', rng.integers(1, 500000, n), 6),
+        'channel': pd.Categorical.from_codes(channel_idx, categories=channel_names),
+        'campaign_id': format_ids('camp_', rng.integers(1, 50, n), 3),
+        'ad_placement': format_ids('placement_', rng.integers(1, 200, n), 3),
+        'timestamp': rng.choice(date_range.to_numpy(), size=n),
+        'cost': base_costs[channel_idx] * rng.uniform(0.8, 1.2, n),
+        'device_type': weighted_labels(['mobile', 'desktop', 'tablet'], [0.6, 0.3, 0.1], n),
+        'audience_segment': weighted_labels(['students', 'faculty', 'staff', 'alumni'], [0.5, 0.2, 0.2, 0.1], n),
+        'creative_type': weighted_labels(['image', 'video', 'text'], [0.5, 0.3, 0.2], n)
+    })
 
 def generate_clicks(impressions_df):
     """Generate click events based on impressions"""
     
-    clicks_data = []
-    
-    for _, impression in impressions_df.iterrows():
-        channel = impression['channel']
-        
-        # Channel-specific CTR
-        base_ctr = {
-            'Google Search': 0.03, 'Facebook': 0.02, 'Instagram': 0.025,
-            'TikTok': 0.035, 'YouTube': 0.015, 'Display Network': 0.008,
-            'Campus Radio': 0.01, 'Campus TV': 0.012
-        }[channel]
-        
-        # Adjust CTR based on device and audience
-        ctr_multiplier = 1.0
-        if impression['device_type'] == 'mobile':
-            ctr_multiplier *= 1.2
-        if impression['audience_segment'] == 'students':
-            ctr_multiplier *= 1.1
-        
-        if np.random.random() < base_ctr * ctr_multiplier:
-            click = {
-                'click_id': f'click_{len(clicks_data):08d}',
-                'impression_id': impression['impression_id'],
-                'user_id': impression['user_id'],
-                'channel': channel,
-                'campaign_id': impression['campaign_id'],
-                'ad_placement': impression['ad_placement'],
-                'click_timestamp': impression['timestamp'] + timedelta(seconds=np.random.randint(1, 300)),
-                'device_type': impression['device_type'],
-                'audience_segment': impression['audience_segment']
-            }
-            clicks_data.append(click)
-    
-    return pd.DataFrame(clicks_data)
+    # Channel-specific CTR
+    base_ctr = rate_table(impressions_df['channel'], {
+        'Google Search': 0.03, 'Facebook': 0.02, 'Instagram': 0.025,
+        'TikTok': 0.035, 'YouTube': 0.015, 'Display Network': 0.008,
+        'Campus Radio': 0.01, 'Campus TV': 0.012
+    })
+    
+    # Adjust CTR based on device and audience
+    device_multiplier = rate_table(impressions_df['device_type'], {'mobile': 1.2}, default=1.0)
+    audience_multiplier = rate_table(impressions_df['audience_segment'], {'students': 1.1}, default=1.0)
+    
+    # One Bernoulli draw per impression selects the clicked rows
+    clicked = bernoulli_mask(rng.random(len(impressions_df)), base_ctr, device_multiplier, audience_multiplier)
+    n_clicks = int(clicked.sum())
+    
+    clicks_df = impressions_df.loc[clicked, [
+        'impression_id', 'user_id', 'channel', 'campaign_id', 'ad_placement',
+        'timestamp', 'device_type', 'audience_segment'
+    ]].reset_index(drop=True).rename(columns={'timestamp': 'click_timestamp'})
+    clicks_df['click_timestamp'] += pd.to_timedelta(rng.integers(1, 300, n_clicks), unit='s')
+    clicks_df.insert(0, 'click_id', np.arange(n_clicks, dtype=np.int64))
+    
+    return clicks_df
 
 def generate_conversions(clicks_df):
     """Generate conversion events based on clicks"""
     
-    conversions_data = []
-    
-    for _, click in clicks_df.iterrows():
-        channel = click['channel']
-        
-        # Channel-specific conversion rates
-        base_conversion_rate = {
-            'Google Search': 0.08, 'Facebook': 0.04, 'Instagram': 0.035,
-            'TikTok': 0.03, 'YouTube': 0.05, 'Display Network': 0.015,
-            'Campus Radio': 0.02, 'Campus TV': 0.055
-        }[channel]
-        
-        # Adjust conversion rate based on audience
-        conv_multiplier = 1.0
-        if click['audience_segment'] == 'students':
-            conv_multiplier *= 1.3
-        elif click['audience_segment'] == 'alumni':
-            conv_multiplier *= 0.8
-        
-        if np.random.random() < base_conversion_rate * conv_multiplier:
-            # Random conversion delay (1 minute to 7 days)
-            conversion_delay = timedelta(
-                minutes=np.random.randint(1, 60),
-                hours=np.random.randint(0, 24),
-                days=np.random.randint(0, 7)
-            )
-            
-            conversion = {
-                'conversion_id': f'conv_{len(conversions_data):08d}',
-                'click_id': click['click_id'],
-                'user_id': click['user_id'],
-                'channel': channel,
-                'campaign_id': click['campaign_id'],
-                'ad_placement': click['ad_placement'],
-                'conversion_timestamp': click['click_timestamp'] + conversion_delay,
-                'conversion_value': np.random.uniform(20, 500),  # Revenue per conversion
-                'conversion_type': np.random.choice(['purchase', 'signup', 'download'], p=[0.6, 0.3, 0.1]),
-                'device_type': click['device_type'],
-                'audience_segment': click['audience_segment']
-            }
-            conversions_data.append(conversion)
-    
-    return pd.DataFrame(conversions_data)
+    # Channel-specific conversion rates
+    base_conversion_rate = rate_table(clicks_df['channel'], {
+        'Google Search': 0.08, 'Facebook': 0.04, 'Instagram': 0.035,
+        'TikTok': 0.03, 'YouTube': 0.05, 'Display Network': 0.015,
+        'Campus Radio': 0.02, 'Campus TV': 0.055
+    })
+    
+    # Adjust conversion rate based on audience
+    audience_multiplier = rate_table(clicks_df['audience_segment'], {'students': 1.3, 'alumni': 0.8}, default=1.0)
+    
+    converted = bernoulli_mask(rng.random(len(clicks_df)), base_conversion_rate, audience_multiplier)
+    n_conversions = int(converted.sum())
+    
+    # Random conversion delay (1 minute to 7 days), drawn in seconds
+    conversion_delay = pd.to_timedelta(rng.integers(60, 7 * 24 * 3600, n_conversions), unit='s')
+    
+    conversions_df = clicks_df.loc[converted, [
+        'click_id', 'user_id', 'channel', 'campaign_id', 'ad_placement',
+        'click_timestamp', 'device_type', 'audience_segment'
+    ]].reset_index(drop=True).rename(columns={'click_timestamp': 'conversion_timestamp'})
+    conversions_df['conversion_timestamp'] += conversion_delay
+    conversions_df.insert(0, 'conversion_id', np.arange(n_conversions, dtype=np.int64))
+    conversions_df.insert(7, 'conversion_value', rng.uniform(20, 500, n_conversions))  # Revenue per conversion
+    conversions_df.insert(8, 'conversion_type', weighted_labels(
+        ['purchase', 'signup', 'download'], [0.6, 0.3, 0.1], n_conversions
+    ))
+    
+    return conversions_df
 
 def main():
     """Generate all synthetic datasets"""
@@ -172,9 +212,9 @@ def main():
     
     # Save datasets
     print("Saving datasets...")
-    impressions_df.to_csv('data/raw_impressions.csv', index=False)
-    clicks_df.to_csv('data/raw_clicks.csv', index=False)
-    conversions_df.to_csv('data/raw_conversions.csv', index=False)
+    with_string_ids(impressions_df).to_csv('data/raw_impressions.csv', index=False)
+    with_string_ids(clicks_df).to_csv('data/raw_clicks.csv', index=False)
+    with_string_ids(conversions_df).to_csv('data/raw_conversions.csv', index=False)
     
     # Print summary statistics
     print(f"\nDataset Summary:")